@@ -8,31 +8,95 @@ The output is saved as a PNG or TGA file.
 
 Usage:
     python channel_packer.py <red_channel_image> <green_channel_image> <blue_channel_image> <output_image> [--alpha <alpha_channel_image>] [--resolution WIDTHxHEIGHT]
+    python channel_packer.py batch <manifest.json> [--jobs N]
 
 Example:
     python channel_packer.py image1.png image2.png image3.png packed_output.png
     python channel_packer.py r.png g.png b.png output.tga --alpha alpha.png
     python channel_packer.py r.png g.png b.png output.png --resolution 1024x768
+    python channel_packer.py batch texture_sets.json --jobs 8
 """
 
 import sys
 import os
+import functools
+import struct
+from concurrent.futures import ThreadPoolExecutor
+import PIL
 from PIL import Image
 import numpy as np
 
+try:
+    import cv2
+except ImportError:
+    # OpenCV is optional; Pillow handles resizing without it
+    cv2 = None
 
-def extract_channels_from_image(image_path):
+try:
+    from _kernels import pack_rgba
+except ImportError:
+    # The kernels module itself guards the numba import, but keep the
+    # packer working even if the module is missing entirely
+    pack_rgba = None
+
+
+@functools.lru_cache(maxsize=8)
+def _open_cached(image_path, mtime):
+    """
+    Open and fully decode an image, cached on (path, mtime).
+
+    Workflows often load channels from and extract channels of the same
+    file; caching the decoded image means the second access is a dict
+    lookup instead of a full decode. The mtime key invalidates the entry
+    when the file changes on disk.
+    """
+    image = Image.open(image_path)
+    image.load()
+    return image
+
+
+def clear_image_cache():
+    """
+    Drop the decoded-image cache.
+
+    The cache holds strong references to up to 8 full-resolution images,
+    so callers that release their own copies to reclaim memory (the GUI
+    after a pack) must clear it too or the buffers stay pinned here.
+    """
+    _open_cached.cache_clear()
+
+
+def extract_channels_from_image(image_path, as_numpy=False):
     """
     Extract individual channels from a multi-channel image.
-    
+
     Args:
         image_path (str): Path to the input image
-        
+        as_numpy (bool): Return zero-copy numpy views of each channel
+            instead of PIL images. Avoids the per-band image allocations
+            split() makes when the caller only needs array data;
+            pack_channels accepts these views directly.
+
     Returns:
-        dict: Dictionary with channel names as keys and PIL Images as values
+        dict: Dictionary with channel names as keys and PIL Images
+            (or numpy views) as values
     """
     try:
-        image = Image.open(image_path)
+        image = _open_cached(image_path, os.path.getmtime(image_path))
+
+        if as_numpy:
+            if image.mode not in ('RGB', 'RGBA', 'L'):
+                image = image.convert('RGB')
+            array = np.asarray(image)
+            if array.ndim == 2:
+                return {'red': array, 'green': None, 'blue': None, 'alpha': None}
+            return {
+                'red': array[..., 0],
+                'green': array[..., 1],
+                'blue': array[..., 2],
+                'alpha': array[..., 3] if array.shape[2] == 4 else None,
+            }
+
         channels = {}
         
         if image.mode == 'RGB':
@@ -91,27 +155,113 @@ def save_channels_individually(channels, base_path):
         return []
 
 
-def load_grayscale_image(image_path):
+def load_grayscale_image(image_path, target_size=None):
     """
     Load an image and convert it to grayscale.
-    
+
     Args:
         image_path (str): Path to the input image
-        
+        target_size (tuple, optional): Approximate size the caller needs.
+            Lets the JPEG decoder downscale in the DCT domain via draft(),
+            cutting decode work by up to 64x; a no-op for other formats.
+
     Returns:
         PIL.Image: Grayscale image
     """
     try:
-        image = Image.open(image_path)
+        if target_size:
+            # draft() must run before the pixel data is decoded, so this
+            # path bypasses the full-resolution decode cache
+            image = Image.open(image_path)
+            image.draft('L', target_size)
+            image.load()
+        else:
+            image = _open_cached(image_path, os.path.getmtime(image_path))
         # Convert to grayscale if not already
         if image.mode != 'L':
             image = image.convert('L')
         return image
+    except FileNotFoundError:
+        print(f"Error: Input file '{image_path}' does not exist.")
+        return None
     except Exception as e:
         print(f"Error loading image {image_path}: {e}")
         return None
 
 
+def _write_tga(output_path, packed, has_alpha):
+    """
+    Write a packed RGBA buffer as an uncompressed top-left-origin TGA.
+
+    TGA stores raw BGR(A) pixels behind an 18-byte header, so saving is a
+    channel-order gather plus one sequential write with no compression or
+    encoder work at all; throughput is limited only by disk bandwidth.
+
+    Args:
+        output_path (str): Path for the output file
+        packed (numpy.ndarray): HxWx4 uint8 RGBA buffer
+        has_alpha (bool): Whether to emit 32-bit BGRA or 24-bit BGR pixels
+    """
+    height, width = packed.shape[:2]
+    if has_alpha:
+        pixels = packed[..., [2, 1, 0, 3]]
+        bits_per_pixel, descriptor = 32, 0x28
+    else:
+        pixels = packed[..., [2, 1, 0]]
+        bits_per_pixel, descriptor = 24, 0x20
+    header = struct.pack('<BBBHHBHHHHBB', 0, 0, 2, 0, 0, 0, 0, 0,
+                         width, height, bits_per_pixel, descriptor)
+    with open(output_path, 'wb') as output_file:
+        output_file.write(header)
+        output_file.write(pixels.tobytes())
+
+
+# Above this many bytes the packed buffer is backed by a temporary file so
+# the OS can flush its pages lazily instead of doubling peak resident memory
+_MEMMAP_THRESHOLD = 256 * 1024 * 1024
+
+
+def _allocate_packed(height, width, channels=4):
+    """Allocate the HxWxC packed buffer, disk-backed when very large."""
+    if height * width * channels > _MEMMAP_THRESHOLD:
+        import tempfile
+        backing_file = tempfile.TemporaryFile()
+        return np.memmap(backing_file, dtype=np.uint8, mode='w+',
+                         shape=(height, width, channels))
+    return np.empty((height, width, channels), dtype=np.uint8)
+
+
+def _plane_size(plane):
+    """Return (width, height) for a PIL image or a numpy channel view."""
+    if isinstance(plane, np.ndarray):
+        return plane.shape[1], plane.shape[0]
+    return plane.size
+
+
+def resize_plane(img, target_size):
+    """
+    Resize one channel plane with the packer's preferred backend.
+
+    This is the single resize used for packing -- cv2's SIMD LANCZOS4
+    when OpenCV is installed, otherwise Pillow LANCZOS with reducing_gap
+    -- so callers that pre-resize (the GUI) produce exactly the pixels a
+    pack would. Accepts a PIL image or ndarray; the cv2 branch returns
+    an ndarray, which pack_channels consumes directly.
+    """
+    if cv2 is not None:
+        # OpenCV's LANCZOS4 is SIMD-vectorized and resizes the numpy
+        # buffer the packing step needs anyway, skipping the
+        # intermediate PIL resize image
+        return cv2.resize(np.asarray(img), target_size,
+                          interpolation=cv2.INTER_LANCZOS4)
+    if isinstance(img, np.ndarray):
+        img = Image.fromarray(img)
+    # reducing_gap makes Pillow box-reduce large downscales first and
+    # run LANCZOS only on the small remainder (~2x faster on 4x+
+    # reductions); it is ignored when upscaling
+    return img.resize(target_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+
 def resize_images_to_match(images):
     """
     Resize all images to match the dimensions of the largest image.
@@ -122,26 +272,50 @@ def resize_images_to_match(images):
     Returns:
         list: List of resized PIL Images
     """
+    # Cache the dimensions once instead of re-reading width/height per image
+    dims = [img.size for img in images]
+
+    # Common case: all images already match, so no resizing is needed
+    if all(d == dims[0] for d in dims):
+        return list(images)
+
     # Find the maximum dimensions
-    max_width = max(img.width for img in images)
-    max_height = max(img.height for img in images)
-    
+    max_width = max(w for w, h in dims)
+    max_height = max(h for w, h in dims)
+
     # Resize all images to match the maximum dimensions
     resized_images = []
-    for img in images:
-        if img.width != max_width or img.height != max_height:
+    for img, size in zip(images, dims):
+        if size != (max_width, max_height):
             resized_img = img.resize((max_width, max_height), Image.Resampling.LANCZOS)
             resized_images.append(resized_img)
         else:
             resized_images.append(img)
-    
+
     return resized_images
 
 
-def pack_channels(red_image, green_image, blue_image, output_path, alpha_image=None, output_resolution=None):
+def _save_packed(output_path, packed, final_image, has_alpha, compress_level):
+    """Write a packed buffer to disk as TGA or PNG and report the result."""
+    file_ext = os.path.splitext(output_path)[1].lower()
+    if file_ext == '.tga':
+        # Bypass Pillow's encoder and dump the packed buffer directly
+        _write_tga(output_path, packed, has_alpha)
+    else:
+        # Default to PNG
+        if not output_path.lower().endswith('.png'):
+            output_path = os.path.splitext(output_path)[0] + '.png'
+        final_image.save(output_path, 'PNG', compress_level=compress_level, optimize=False)
+
+    print(f"Successfully packed images into {output_path}")
+    print(f"Output image dimensions: {final_image.width}x{final_image.height}")
+    print(f"Output mode: {final_image.mode}")
+
+
+def pack_channels(red_image, green_image, blue_image, output_path, alpha_image=None, output_resolution=None, compress_level=6):
     """
     Pack three or four grayscale images into RGB or RGBA channels and save.
-    
+
     Args:
         red_image (PIL.Image): Image for red channel
         green_image (PIL.Image): Image for green channel
@@ -149,75 +323,97 @@ def pack_channels(red_image, green_image, blue_image, output_path, alpha_image=N
         output_path (str): Path for the output file
         alpha_image (PIL.Image, optional): Image for alpha channel
         output_resolution (tuple, optional): Desired output resolution as (width, height)
+        compress_level (int, optional): PNG zlib level 0-9; 1 trades ~15%
+            file size for a much faster encode
     """
     try:
-        # Collect valid images
+        # Collect valid images ("is not None" rather than truthiness, since
+        # channels may also arrive as numpy views)
         images_to_resize = []
-        if red_image:
+        if red_image is not None:
             images_to_resize.append(red_image)
-        if green_image:
+        if green_image is not None:
             images_to_resize.append(green_image)
-        if blue_image:
+        if blue_image is not None:
             images_to_resize.append(blue_image)
-        if alpha_image:
+        if alpha_image is not None:
             images_to_resize.append(alpha_image)
             
         if not images_to_resize:
             raise Exception("No valid images provided")
             
-        # Get dimensions from largest image
-        max_width = max(img.width for img in images_to_resize)
-        max_height = max(img.height for img in images_to_resize)
-        
-        # Resize images to match dimensions or create black images
-        def resize_or_create_black(img):
+        # Each plane is resampled at most once: straight to the requested
+        # output resolution when one is given, otherwise to the largest
+        # input. This avoids resizing planes to the max size only to
+        # resize the merged result a second time.
+        if output_resolution:
+            target_size = output_resolution
+        else:
+            dims = [_plane_size(img) for img in images_to_resize]
+            target_size = (max(w for w, h in dims), max(h for w, h in dims))
+
+        # Fast path: three same-size RGB inputs and no alpha -- the common
+        # case of renders from one scene -- skip the resize machinery and
+        # the RGBA staging pass and interleave straight into an HxWx3
+        # buffer
+        width, height = target_size
+        if (alpha_image is None
+                and red_image is not None
+                and green_image is not None
+                and blue_image is not None
+                and all(_plane_size(img) == target_size
+                        for img in (red_image, green_image, blue_image))):
+            packed = _allocate_packed(height, width, 3)
+            packed[..., 0] = np.asarray(red_image)
+            packed[..., 1] = np.asarray(green_image)
+            packed[..., 2] = np.asarray(blue_image)
+            final_image = Image.frombuffer('RGB', target_size, packed, 'raw', 'RGB', 0, 1)
+            _save_packed(output_path, packed, final_image, False, compress_level)
+            return
+
+        # Resize images to match the target dimensions; missing channels
+        # stay None and are filled directly in the packed buffer below
+        def resize_to_target(img):
             if img is None:
-                return Image.new('L', (max_width, max_height), 0)
-            elif img.width != max_width or img.height != max_height:
-                return img.resize((max_width, max_height), Image.Resampling.LANCZOS)
-            else:
+                return None
+            if _plane_size(img) == target_size:
                 return img
+            return resize_plane(img, target_size)
+
+        final_red = resize_to_target(red_image)
+        final_green = resize_to_target(green_image)
+        final_blue = resize_to_target(blue_image)
         
-        final_red = resize_or_create_black(red_image)
-        final_green = resize_or_create_black(green_image)
-        final_blue = resize_or_create_black(blue_image)
-        
-        # Convert images to numpy arrays
-        red_array = np.array(final_red)
-        green_array = np.array(final_green)
-        blue_array = np.array(final_blue)
-        
-        # Handle alpha channel
-        if alpha_image:
-            final_alpha = resize_or_create_black(alpha_image)
-            alpha_array = np.array(final_alpha)
-            # Stack the arrays to create RGBA image
-            rgba_array = np.stack([red_array, green_array, blue_array, alpha_array], axis=2)
-            final_image = Image.fromarray(rgba_array, 'RGBA')
+        # Pack into four channels only when an alpha plane exists; the
+        # RGB-only case moves 25% fewer bytes through the buffer and the
+        # encoder and skips the RGBA-to-RGB conversion pass
+        has_alpha = alpha_image is not None
+        packed = _allocate_packed(height, width, 4 if has_alpha else 3)
+        bands = [final_red, final_green, final_blue]
+        if has_alpha:
+            bands.append(resize_to_target(alpha_image))
+        arrays = [None if band is None else np.asarray(band) for band in bands]
+        if pack_rgba is not None and has_alpha and all(array is not None for array in arrays):
+            # Fused parallel interleave; the JIT turns the inner loop into
+            # SIMD stores
+            pack_rgba(arrays[0], arrays[1], arrays[2], arrays[3], packed)
         else:
-            # Stack the arrays to create RGB image
-            rgb_array = np.stack([red_array, green_array, blue_array], axis=2)
-            final_image = Image.fromarray(rgb_array, 'RGB')
+            for index, array in enumerate(arrays):
+                if array is None:
+                    # A scalar fill is a plain memset -- cheaper than
+                    # allocating a black image and copying it in
+                    packed[..., index] = 0 if index < 3 else 255
+                else:
+                    packed[..., index] = array
+
+        mode = 'RGBA' if has_alpha else 'RGB'
+        final_image = Image.frombuffer(mode, target_size, packed, 'raw', mode, 0, 1)
         
-        # Resize to the specified output resolution if provided
         if output_resolution:
-            final_image = final_image.resize(output_resolution, Image.Resampling.LANCZOS)
             print(f"Resized to specified resolution: {output_resolution[0]}x{output_resolution[1]}")
-            
-        # Determine output format based on extension
-        file_ext = os.path.splitext(output_path)[1].lower()
-        if file_ext == '.tga':
-            final_image.save(output_path, 'TGA')
-        else:
-            # Default to PNG
-            if not output_path.lower().endswith('.png'):
-                output_path = os.path.splitext(output_path)[0] + '.png'
-            final_image.save(output_path, 'PNG')
-        
-        print(f"Successfully packed images into {output_path}")
-        print(f"Output image dimensions: {final_image.width}x{final_image.height}")
-        print(f"Output mode: {final_image.mode}")
-        
+
+        _save_packed(output_path, packed, final_image, alpha_image is not None, compress_level)
+
     except Exception as e:
         print(f"Error packing channels: {e}")
 
@@ -230,8 +426,55 @@ def pack_channels_old(red_image, green_image, blue_image, output_path):
     pack_channels(red_image, green_image, blue_image, output_path, None, None)
 
 
+def _pack_one(entry):
+    """Pack a single batch-manifest entry; runs in a worker process."""
+    red_image = load_grayscale_image(entry['r']) if entry.get('r') else None
+    green_image = load_grayscale_image(entry['g']) if entry.get('g') else None
+    blue_image = load_grayscale_image(entry['b']) if entry.get('b') else None
+    alpha_image = load_grayscale_image(entry['a']) if entry.get('a') else None
+    resolution = tuple(entry['resolution']) if entry.get('resolution') else None
+    pack_channels(red_image, green_image, blue_image, entry['out'], alpha_image, resolution,
+                  compress_level=entry.get('compress_level', 6))
+    return entry['out']
+
+
+def batch_main(argv):
+    """
+    Pack many outputs described by a JSON manifest in one process.
+
+    Each invocation of the script pays Python/Pillow/numpy startup; batch
+    mode amortizes that across the whole set and packs independent outputs
+    in parallel across cores. The manifest is a list of entries like
+    {"r": ..., "g": ..., "b": ..., "a": ..., "out": ...} where any channel
+    may be omitted.
+    """
+    import argparse
+    import json
+    import multiprocessing
+
+    parser = argparse.ArgumentParser(prog="channel_packer.py batch",
+                                     description="Pack multiple channel sets from a JSON manifest.")
+    parser.add_argument("manifest", help="JSON file with a list of {r, g, b, a, out} entries")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count(),
+                        help="Number of worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    with open(args.manifest) as manifest_file:
+        entries = json.load(manifest_file)
+
+    print(f"Packing {len(entries)} output(s) with {args.jobs} worker(s)...")
+    with multiprocessing.Pool(args.jobs) as pool:
+        for done, output_path in enumerate(pool.imap_unordered(_pack_one, entries), 1):
+            print(f"[{done}/{len(entries)}] {output_path}")
+
+
 def main():
     """Main function to handle command line arguments and execute the packing."""
+    # Batch mode has its own argument set
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        batch_main(sys.argv[2:])
+        return
+
     # Parse arguments
     import argparse
     
@@ -242,9 +485,20 @@ def main():
     parser.add_argument("output", help="Output filename")
     parser.add_argument("--alpha", "-a", help="Optional image to use for the alpha channel")
     parser.add_argument("--resolution", "-r", help="Output resolution in format WIDTHxHEIGHT (e.g., 1024x1024)")
-    
+    parser.add_argument("--compress-level", type=int, default=6, choices=range(0, 10),
+                        help="PNG compression level 0-9 (default: 6)")
+    parser.add_argument("--fast", action="store_true",
+                        help="Throughput mode: alias for --compress-level 1 "
+                             "(roughly 4-5x faster encode for ~15%% larger files)")
+
     args = parser.parse_args()
-    
+
+    # Pillow-SIMD versions carry a '.postN' suffix; plain Pillow resizes
+    # LANCZOS without SIMD, which dominates runtime when resizing is needed
+    if 'post' not in PIL.__version__:
+        print("Note: Pillow-SIMD not detected; install it for faster resizing "
+              "(pip uninstall pillow && pip install pillow-simd)")
+
     red_path = args.red_channel
     green_path = args.green_channel
     blue_path = args.blue_channel
@@ -262,22 +516,16 @@ def main():
             print(f"Error: Invalid resolution format '{args.resolution}'. Should be WIDTHxHEIGHT (e.g., 1024x1024)")
             sys.exit(1)
     
-    # Verify input files exist
-    for path in [red_path, green_path, blue_path]:
-        if not os.path.exists(path):
-            print(f"Error: Input file '{path}' does not exist.")
-            sys.exit(1)
-    
-    if alpha_path and not os.path.exists(alpha_path):
-        print(f"Error: Alpha channel file '{alpha_path}' does not exist.")
-        sys.exit(1)
-    
-    # Load the grayscale images
+    # Missing files surface as a friendly error from load_grayscale_image,
+    # so there is no need to pre-stat every input here
+
+    # Load the grayscale images concurrently; PIL releases the GIL while
+    # decoding, so the three or four decodes overlap on multi-core machines
     print("Loading images...")
-    red_image = load_grayscale_image(red_path)
-    green_image = load_grayscale_image(green_path)
-    blue_image = load_grayscale_image(blue_path)
-    alpha_image = load_grayscale_image(alpha_path) if alpha_path else None
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        red_image, green_image, blue_image, alpha_image = executor.map(
+            lambda path: load_grayscale_image(path, output_resolution) if path else None,
+            [red_path, green_path, blue_path, alpha_path])
     
     # Check if all images loaded successfully
     if not all([red_image, green_image, blue_image]):
@@ -292,7 +540,9 @@ def main():
     
     # Pack the channels
     print("Packing channels...")
-    pack_channels(red_image, green_image, blue_image, output_path, alpha_image, output_resolution)
+    compress_level = 1 if args.fast else args.compress_level
+    pack_channels(red_image, green_image, blue_image, output_path, alpha_image, output_resolution,
+                  compress_level=compress_level)
 
 
 if __name__ == "__main__":
@@ -12,65 +12,250 @@ Features:
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, filedialog, messagebox
-import tkinterdnd2 as tkdnd
 from PIL import Image, ImageTk
+import numpy as np
+import gc
 import os
+import time
 import threading
-from channel_packer import pack_channels, load_grayscale_image, extract_channels_from_image, save_channels_individually
+import concurrent.futures
+from channel_packer import (pack_channels, load_grayscale_image, extract_channels_from_image,
+                            save_channels_individually, clear_image_cache, resize_plane, _plane_size)
 
 
-class DropZone(tk.Frame):
+# tkinterdnd2 is the slowest import here and strictly optional (the
+# zones still work via click-to-browse without it), so it is resolved
+# on first use rather than at module import; tools that import this
+# module for its classes no longer pay for or require it
+_tkdnd = None
+_tkdnd_checked = False
+
+
+def _get_tkdnd():
+    """Import tkinterdnd2 lazily, returning None when unavailable."""
+    global _tkdnd, _tkdnd_checked
+    if not _tkdnd_checked:
+        _tkdnd_checked = True
+        try:
+            import tkinterdnd2
+            _tkdnd = tkinterdnd2
+        except ImportError:
+            _tkdnd = None
+    return _tkdnd
+
+
+# Bound once: saves the module/enum attribute walks on every preview
+# (Image.Resampling.LANCZOS is two LOAD_ATTRs per call otherwise)
+_LANCZOS = Image.Resampling.LANCZOS
+_PhotoImage = ImageTk.PhotoImage
+
+
+# Shared pool for decode work (drops, extraction). A fixed pool caps
+# concurrent decodes at four and recycles threads instead of paying a
+# thread spawn per drop; PIL releases the GIL in its decoders, so the
+# workers genuinely overlap
+_LOAD_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix='loader')
+
+
+# Preview thumbnails keyed by (path, mtime, edge) -- or (id(image), size,
+# edge) for extracted channels without a file -- so re-dropping or
+# re-extracting the same source skips the full-resolution resample
+_THUMB_CACHE = {}
+_THUMB_CACHE_MAX = 16
+
+
+# Full-resolution decodes of likely companion channel files, filled by
+# _prefetch_siblings after a successful drop; keyed by (path, mtime)
+# with the same bounded-FIFO eviction as the thumbnail cache
+_PREFETCH_CACHE = {}
+_PREFETCH_CACHE_MAX = 8
+
+# Suffix families checked for companions: after foo_R.png is dropped,
+# foo_G/B/A.png are decoded ahead of the drops that usually follow
+_SIBLING_SUFFIX_GROUPS = (
+    ('_R', '_G', '_B', '_A'),
+    ('_r', '_g', '_b', '_a'),
+    ('.red', '.green', '.blue', '.alpha'),
+)
+
+
+def _prefetch_siblings(file_path):
+    """Decode likely companion channel files into the prefetch cache.
+
+    Runs on the loader pool after a drop: someone loading foo_R.png is
+    almost certainly about to drop foo_G/B/A.png too, so those decodes
+    happen now and the later drops resolve from _PREFETCH_CACHE instead
+    of paying a full read+decode each.
+    """
+    stem, ext = os.path.splitext(file_path)
+    for group in _SIBLING_SUFFIX_GROUPS:
+        for suffix in group:
+            if not stem.endswith(suffix):
+                continue
+            base = stem[:-len(suffix)]
+            for other in group:
+                if other == suffix:
+                    continue
+                candidate = base + other + ext
+                try:
+                    mtime = os.path.getmtime(candidate)
+                except OSError:
+                    continue  # No such sibling on disk
+                key = (candidate, mtime)
+                if key in _PREFETCH_CACHE:
+                    continue
+                image = load_grayscale_image(candidate)
+                if image is not None:
+                    if len(_PREFETCH_CACHE) >= _PREFETCH_CACHE_MAX:
+                        _PREFETCH_CACHE.pop(next(iter(_PREFETCH_CACHE)))
+                    _PREFETCH_CACHE[key] = image
+            return
+
+
+def _make_thumbnail(image):
+    """Build the preview thumbnail with resize(), which allocates only
+    the small output image; copy()+thumbnail() would memcpy the whole
+    full-resolution buffer first just to preserve the original."""
+    width, height = image.size
+    # An integer box-reduce handles the bulk of a large downscale as a
+    # cheap memory-bound average, leaving the proper resample to run on
+    # a source no larger than ~2x the thumbnail
+    factor = min(width // 260, height // 260)
+    if factor > 1 and hasattr(image, 'reduce'):
+        image = image.reduce(factor)
+        width, height = image.size
+    scale = max(width, height) / 130
+    if scale > 1:
+        thumb_size = (max(1, int(width / scale)), max(1, int(height / scale)))
+        return image.resize(thumb_size, _LANCZOS)
+    return image
+
+
+def _make_preview(image, path=None, mtime=None):
+    """Return a cached preview thumbnail for an image, resampling on miss."""
+    if path is not None and mtime is not None:
+        key = (path, mtime, 130)
+        anchor = None
+    else:
+        # id() keys are only stable while the object lives, so pin the
+        # source in the entry; otherwise a recycled id could serve this
+        # thumbnail for a different same-size image
+        key = (id(image), image.size, 130)
+        anchor = image
+    cached = _THUMB_CACHE.get(key)
+    if cached is None:
+        cached = (anchor, _make_thumbnail(image))
+        if len(_THUMB_CACHE) >= _THUMB_CACHE_MAX:
+            _THUMB_CACHE.pop(next(iter(_THUMB_CACHE)))
+        _THUMB_CACHE[key] = cached
+    return cached[1]
+
+
+# Folded to a single constant at compile time; building it inside
+# create_widgets would concatenate the parts on every launch
+_INSTRUCTIONS = (
+    "Instructions:\n"
+    "1. Load a multi-channel image (.png/.tga) and click 'Extract Channels' to auto-fill all channels\n"
+    "2. Or drag/drop individual images to each channel manually\n"
+    "3. Use 'Export All Channels' to save individual channel images as separate PNG files\n"
+    "4. Use 'Pack Channels' to combine channels into a single RGB/RGBA image\n"
+    "5. Enable 'Custom resolution' to resize the output image to a specific width and height\n"
+    "6. Alpha channel is supported for .tga and .png output formats"
+)
+
+
+def _init_drop_styles(widget):
+    """Configure the state-mapped drop-zone styles (idempotent).
+
+    Mapping the background on the 'selected' state lets a zone flip
+    between empty and loaded colors with one state bit per widget
+    instead of re-resolving a bg option through Tcl each time.
+    """
+    style = ttk.Style(widget)
+    style.configure('Drop.TFrame', background='lightgray')
+    style.map('Drop.TFrame', background=[('selected', '#e8f5e8')])
+    style.configure('Drop.TLabel', background='lightgray')
+    style.map('Drop.TLabel', background=[('selected', '#e8f5e8')])
+
+
+class DropZone(ttk.Frame):
     """A drag-and-drop zone for image files."""
-    
-    def __init__(self, parent, channel_name, color, callback=None):
-        super().__init__(parent, relief="raised", borderwidth=2)
+
+    def __init__(self, parent, channel_name, color, callback=None, fonts=None, gui=None, bit=0):
+        _init_drop_styles(parent)
+        super().__init__(parent, relief="raised", borderwidth=2, style='Drop.TFrame')
+        if fonts is None:
+            # Standalone fallback; the GUI passes its shared font cache
+            fonts = {'heading': ("Arial", 10, "bold"),
+                     'tiny': ("Arial", 8),
+                     'path': ("Arial", 7)}
+        self.gui = gui  # Owning ChannelPackerGUI, for status-bar errors
+        self.bit = bit  # This zone's flag in the GUI's loaded-state mask
         self.callback = callback
         self.channel_name = channel_name
         self.color = color
         self.image_path = None
         self.preview_image = None
         self.channel_image = None  # Store the actual PIL image
+        self.channel_array = None  # Lazy uint8 view of channel_image
+        self.resized_image = None  # Pre-resized copy prepared in the background
+        self._mtime = None
+        self._load_seq = 0  # Increments per load; stale workers bail out
+        self._suspend_callback = False  # Set during batch updates
         
         # Configure the drop zone
-        self.configure(bg="lightgray", width=180, height=180)
+        self.configure(width=180, height=180)
         self.pack_propagate(False)
-        
+
         # Create label for channel name
-        self.channel_label = tk.Label(
-            self, 
+        self.channel_label = ttk.Label(
+            self,
             text=f"{channel_name} Channel",
-            font=("Arial", 10, "bold"),
-            fg=color,
-            bg="lightgray"
+            font=fonts['heading'],
+            foreground=color,
+            style='Drop.TLabel'
         )
         self.channel_label.pack(pady=3)
-        
+
         # Create preview label
-        self.preview_label = tk.Label(
+        self.preview_label = ttk.Label(
             self,
             text="Drop image here\nor click to browse",
-            font=("Arial", 8),
-            fg="gray",
-            bg="lightgray",
-            wraplength=160
+            font=fonts['tiny'],
+            foreground="gray",
+            style='Drop.TLabel',
+            wraplength=160,
+            anchor="center",
+            justify="center"
         )
         self.preview_label.pack(expand=True)
-        
+
         # Create file path label
-        self.path_label = tk.Label(
+        self.path_label = ttk.Label(
             self,
             text="No file selected",
-            font=("Arial", 7),
-            fg="darkgray",
-            bg="lightgray",
-            wraplength=170
+            font=fonts['path'],
+            foreground="darkgray",
+            style='Drop.TLabel',
+            wraplength=170,
+            anchor="center",
+            justify="center"
         )
         self.path_label.pack(side="bottom", pady=1)
         
-        # Enable drag and drop
-        self.drop_target_register(tkdnd.DND_FILES)
-        self.dnd_bind('<<Drop>>', self.on_drop)
+        # Enable drag and drop when tkinterdnd2 is available and the
+        # root window was created with drop support; otherwise the zone
+        # degrades to click-to-browse only
+        tkdnd = _get_tkdnd()
+        if tkdnd is not None:
+            try:
+                self.drop_target_register(tkdnd.DND_FILES)
+                self.dnd_bind('<<Drop>>', self.on_drop)
+            except (AttributeError, tk.TclError):
+                pass
         
         # Enable click to browse
         self.bind("<Button-1>", self.on_click)
@@ -84,7 +269,7 @@ class DropZone(tk.Frame):
         """Handle file drop event."""
         files = self.tk.splitlist(event.data)
         if files:
-            self.load_image(files[0])
+            self.load_image(os.path.normpath(os.fsdecode(files[0])))
     
     def on_click(self, event):
         """Handle click to browse for file."""
@@ -96,87 +281,184 @@ class DropZone(tk.Frame):
             ]
         )
         if file_path:
-            self.load_image(file_path)
-    
-    def load_image(self, file_path):
-        """Load and preview an image."""
+            # The dialog only returns paths that exist, so the worker can
+            # skip its existence stat (which may block on network mounts)
+            self.load_image(file_path, from_dialog=True)
+
+    def load_image(self, file_path, from_dialog=False):
+        """Load and preview an image without blocking the Tk event loop."""
+        # Re-dropping the file already shown here is a no-op as long as
+        # it hasn't changed on disk; one stat beats a full re-read
+        if file_path == self.image_path and self.channel_image is not None:
+            try:
+                if os.path.getmtime(file_path) == self._mtime:
+                    return
+            except OSError:
+                pass
+
+        # Show immediate feedback; the decode and thumbnail run off-thread
+        # so large files don't freeze drag-drop and click handling.  The
+        # sequence token lets a rapid re-drop supersede an in-flight load
+        # so only the newest file's preview is ever applied.
+        self._load_seq += 1
+        self.preview_label.configure(image="", text="Loading...")
+        _LOAD_EXECUTOR.submit(self._load_worker, file_path, self._load_seq, from_dialog)
+
+    def _show_thumbnail_if_current(self, thumbnail, seq):
+        """Main-thread handler for an early preview from a draft decode."""
+        if seq == self._load_seq:
+            self._show_thumbnail(thumbnail)
+
+    def _load_worker(self, file_path, seq, from_dialog=False):
+        """Worker thread: decode the image and build the preview thumbnail."""
         try:
-            # Validate file exists and is an image
-            if not os.path.exists(file_path):
-                messagebox.showerror("Error", f"File not found: {file_path}")
+            # Validate dropped files exist; dialog selections already do
+            if not from_dialog and not os.path.exists(file_path):
+                self.after(0, self._load_failed, f"File not found: {file_path}", seq)
                 return
-            
-            # Try to load the image
-            test_image = load_grayscale_image(file_path)
+
+            # For JPEGs, show a preview from a cheap draft decode first:
+            # libjpeg can decode at 1/2-1/8 scale in the DCT domain, so
+            # the thumbnail appears long before the full-resolution decode
+            # (still needed for packing) finishes below
+            thumbnail = None
+            ext = os.path.splitext(file_path)[1].lower()
+            if ext in ('.jpg', '.jpeg'):
+                draft_image = load_grayscale_image(file_path, target_size=(300, 300))
+                if draft_image is not None:
+                    # Draft previews are transient, so bypass the cache
+                    thumbnail = _make_thumbnail(draft_image)
+                    self.after(0, self._show_thumbnail_if_current, thumbnail, seq)
+
+            # Load the full-resolution image for packing; a sibling
+            # prefetch may have decoded this file already.  pop() rather
+            # than get() so the cache doesn't pin a second full-res
+            # reference once the zone owns the image.
+            test_image = None
+            try:
+                mtime = os.path.getmtime(file_path)
+            except OSError:
+                mtime = None
+            if mtime is not None:
+                test_image = _PREFETCH_CACHE.pop((file_path, mtime), None)
+            if test_image is None:
+                test_image = load_grayscale_image(file_path)
             if test_image is None:
-                messagebox.showerror("Error", f"Could not load image: {file_path}")
+                self.after(0, self._load_failed, f"Could not load image: {file_path}", seq)
                 return
-            
-            self.image_path = file_path
-            self.channel_image = test_image
-            
-            # Create preview thumbnail
-            thumbnail = test_image.copy()
-            thumbnail.thumbnail((130, 130), Image.Resampling.LANCZOS)
-            
-            # Convert to PhotoImage for display
-            self.preview_image = ImageTk.PhotoImage(thumbnail)
-            
-            # Update the preview
-            self.preview_label.configure(image=self.preview_image, text="")
-            
-            # Update path label
+
+            # Superseded by a newer drop: skip the thumbnail work entirely
+            if seq != self._load_seq:
+                return
+
+            if thumbnail is None:
+                thumbnail = _make_preview(test_image, file_path, mtime)
+
+            # Display name is computed here so the Tk thread doesn't
+            # touch the path again
             filename = os.path.basename(file_path)
             if len(filename) > 22:
                 filename = filename[:19] + "..."
-            self.path_label.configure(text=filename, fg="black")
-            
-            # Change background color to indicate loaded
-            self.configure(bg="#e8f5e8")
-            self.channel_label.configure(bg="#e8f5e8")
-            self.preview_label.configure(bg="#e8f5e8")
-            self.path_label.configure(bg="#e8f5e8")
-            
-            # Call callback if provided
-            if self.callback:
-                self.callback()
-                
+
+            # PhotoImage creation and widget updates must happen on the
+            # Tk thread
+            self.after(0, self._apply_preview, test_image, thumbnail, file_path,
+                       filename, mtime, seq)
+
+            # Warm up the companion channels this drop probably precedes
+            _LOAD_EXECUTOR.submit(_prefetch_siblings, file_path)
+
         except Exception as e:
-            messagebox.showerror("Error", f"Error loading image: {str(e)}")
-    
+            self.after(0, self._load_failed, f"Error loading image: {str(e)}", seq)
+
+    def _set_loaded(self, loaded):
+        """Flip the zone between its empty and loaded colors.
+
+        The colors live in the state-mapped Drop styles, so this is one
+        state-bit toggle per widget instead of re-resolving a bg option
+        through Tcl; Tk coalesces the changes into a single repaint.
+        """
+        state = ['selected'] if loaded else ['!selected']
+        for widget in (self, self.channel_label, self.preview_label, self.path_label):
+            widget.state(state)
+
+    def _show_thumbnail(self, thumbnail):
+        """Display a thumbnail on the preview label.
+
+        When a photo of the same size is already registered with Tk, its
+        pixels are updated in place via paste() instead of destroying and
+        re-registering a Tk image resource on every re-drop.
+        """
+        if (self.preview_image is not None
+                and (self.preview_image.width(), self.preview_image.height()) == thumbnail.size):
+            self.preview_image.paste(thumbnail)
+        else:
+            self.preview_image = _PhotoImage(thumbnail)
+        self.preview_label.configure(image=self.preview_image, text="")
+
+    def _load_failed(self, message, seq=None):
+        """Main-thread handler for a failed load."""
+        if seq is not None and seq != self._load_seq:
+            return
+        self.preview_label.configure(
+            image="",
+            text="Drop image here\nor click to browse"
+        )
+        # A modal dialog would spin a nested event loop and block further
+        # drops; prefer the owning GUI's transient status-bar message
+        if self.gui is not None:
+            self.gui._show_error(message)
+        else:
+            messagebox.showerror("Error", message)
+
+    def _apply_channel_image(self, image, thumbnail, path_text, path_color):
+        """Attach a decoded channel and refresh the zone display.
+
+        Single home for the preview/path/state sequence shared by drop
+        loads and extraction; preview fast paths land here once.
+        """
+        self.channel_image = image
+        self.channel_array = None
+        self.resized_image = None
+        if self.gui is not None:
+            self.gui._check_channel_size(self, image.size)
+
+        # Show the preview, reusing the Tk photo where possible
+        self._show_thumbnail(thumbnail)
+
+        # Update path label
+        self.path_label.configure(text=path_text, foreground=path_color)
+
+        # Change background color to indicate loaded
+        self._set_loaded(True)
+        if self.gui is not None:
+            self.gui._loaded_mask |= self.bit
+
+        # Call callback if provided
+        if self.callback and not self._suspend_callback:
+            self.callback()
+
+    def _apply_preview(self, test_image, thumbnail, file_path, filename, mtime, seq):
+        """Main-thread handler: attach the decoded image and show the preview."""
+        if seq != self._load_seq:
+            return
+        self.image_path = file_path
+        # Remember when the file was decoded so a re-drop of the same
+        # unchanged file can reuse the cached image
+        self._mtime = mtime
+        self._apply_channel_image(test_image, thumbnail, filename, "black")
+
     def set_channel_image(self, channel_image, source_info=""):
         """Set the channel image directly from a PIL Image."""
         if channel_image is None:
             self.clear_image()
             return
-            
+
         try:
-            self.channel_image = channel_image
             self.image_path = None  # No file path since it's extracted
-            
-            # Create preview thumbnail
-            thumbnail = channel_image.copy()
-            thumbnail.thumbnail((130, 130), Image.Resampling.LANCZOS)
-            
-            # Convert to PhotoImage for display
-            self.preview_image = ImageTk.PhotoImage(thumbnail)
-            
-            # Update the preview
-            self.preview_label.configure(image=self.preview_image, text="")
-            
-            # Update path label
-            self.path_label.configure(text=f"From: {source_info}", fg="blue")
-            
-            # Change background color to indicate loaded
-            self.configure(bg="#e8f5e8")
-            self.channel_label.configure(bg="#e8f5e8")
-            self.preview_label.configure(bg="#e8f5e8")
-            self.path_label.configure(bg="#e8f5e8")
-            
-            # Call callback if provided
-            if self.callback:
-                self.callback()
-                
+            self._mtime = None
+            thumbnail = _make_preview(channel_image)
+            self._apply_channel_image(channel_image, thumbnail, f"From: {source_info}", "blue")
         except Exception as e:
             messagebox.showerror("Error", f"Error setting channel image: {str(e)}")
     
@@ -185,6 +467,9 @@ class DropZone(tk.Frame):
         self.image_path = None
         self.preview_image = None
         self.channel_image = None
+        self.channel_array = None
+        self.resized_image = None
+        self._mtime = None
         
         # Reset preview
         self.preview_label.configure(
@@ -193,17 +478,28 @@ class DropZone(tk.Frame):
         )
         
         # Reset path label
-        self.path_label.configure(text="No file selected", fg="darkgray")
-        
+        self.path_label.configure(text="No file selected", foreground="darkgray")
+
         # Reset background color
-        self.configure(bg="lightgray")
-        self.channel_label.configure(bg="lightgray")
-        self.preview_label.configure(bg="lightgray")
-        self.path_label.configure(bg="lightgray")
+        self._set_loaded(False)
+        if self.gui is not None:
+            self.gui._loaded_mask &= ~self.bit
+            if self.gui._loaded_mask == 0:
+                self.gui._ref_size = None
     
     def get_channel_image(self):
         """Get the currently loaded channel image."""
         return self.channel_image
+
+    def get_channel_array(self):
+        """Return the channel as a cached uint8 array.
+
+        The PIL-to-ndarray conversion copies the whole plane, so it runs
+        once per loaded image instead of once per pack.
+        """
+        if self.channel_array is None and self.channel_image is not None:
+            self.channel_array = np.asarray(self.channel_image, dtype=np.uint8)
+        return self.channel_array
     
     def get_image_path(self):
         """Get the currently loaded image path."""
@@ -219,14 +515,60 @@ class ChannelPackerGUI:
         self.root.geometry("950x750")
         self.root.resizable(True, True)
         
+        # Shared font objects: Tk resolves each font spec once instead of
+        # re-parsing a ("Arial", N, ...) tuple per widget
+        self.fonts = {
+            'title': tkfont.Font(family='Arial', size=18, weight='bold'),
+            'subtitle': tkfont.Font(family='Arial', size=11),
+            'heading': tkfont.Font(family='Arial', size=10, weight='bold'),
+            'body': tkfont.Font(family='Arial', size=10),
+            'button': tkfont.Font(family='Arial', size=12, weight='bold'),
+            'button_plain': tkfont.Font(family='Arial', size=12),
+            'small': tkfont.Font(family='Arial', size=9),
+            'tiny': tkfont.Font(family='Arial', size=8),
+            'path': tkfont.Font(family='Arial', size=7),
+        }
+
         # Output path
         self.output_path = tk.StringVar(value="packed_output.png")
-        
+
+        # Bitmask of loaded zones (R=1, G=2, B=4, A=8), maintained by the
+        # zones themselves; _last_mask short-circuits redundant refreshes
+        self._loaded_mask = 0
+        self._last_mask = None
+
+        # Size of the first loaded channel, for preflight dimension checks
+        self._ref_size = None
+
+        # Coalesces bursts of zone callbacks into a single idle update
+        self._button_update_pending = False
+
+        # Pending after() id for clearing a transient status-bar error
+        self._status_clear_id = None
+
+        # Timestamp of the last progress-bar update, for rate limiting
+        self._last_progress_update = 0.0
+
+        # One serialized worker owns all pack jobs; a shared executor can
+        # be joined or cancelled on shutdown, unlike ad-hoc threads
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='packer')
+
         # Create GUI components
         self.create_widgets()
-        
+
         # Update button states
         self.update_button_states()
+
+        # Stop the worker when the window closes (the embedded wrapper in
+        # utils_ui has no protocol handler)
+        if hasattr(self.root, 'protocol'):
+            self.root.protocol('WM_DELETE_WINDOW', self._on_close)
+
+    def _on_close(self):
+        """Shut down the pack worker and close the window."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
         
     def toggle_resolution_fields(self):
         """Enable or disable resolution input fields based on checkbox state."""
@@ -236,6 +578,10 @@ class ChannelPackerGUI:
         else:
             self.width_entry.configure(state="disabled")
             self.height_entry.configure(state="disabled")
+        # The pack target changed, so any pre-resized channels are stale
+        for zone in (self.red_zone, self.green_zone, self.blue_zone, self.alpha_zone):
+            zone.resized_image = None
+        self._schedule_button_state_update()
     
     def create_widgets(self):
         """Create all GUI widgets."""
@@ -244,7 +590,7 @@ class ChannelPackerGUI:
         title_label = tk.Label(
             self.root,
             text="Enhanced Channel Packer",
-            font=("Arial", 18, "bold"),
+            font=self.fonts['title'],
             fg="#2c3e50"
         )
         title_label.pack(pady=10)
@@ -253,29 +599,29 @@ class ChannelPackerGUI:
         subtitle_label = tk.Label(
             self.root,
             text="Load multi-channel images or individual channel images • Support for PNG and TGA files",
-            font=("Arial", 11),
+            font=self.fonts['subtitle'],
             fg="#7f8c8d"
         )
         subtitle_label.pack(pady=(0, 10))
         
         # Multi-channel image loader section
-        loader_frame = tk.LabelFrame(self.root, text="Load Multi-Channel Image", font=("Arial", 10, "bold"))
+        loader_frame = tk.LabelFrame(self.root, text="Load Multi-Channel Image", font=self.fonts['heading'])
         loader_frame.pack(pady=10, padx=20, fill="x")
         
         load_controls_frame = tk.Frame(loader_frame)
         load_controls_frame.pack(fill="x", padx=10, pady=10)
         
-        tk.Label(load_controls_frame, text="Select image file:", font=("Arial", 10)).pack(side="left")
+        tk.Label(load_controls_frame, text="Select image file:", font=self.fonts['body']).pack(side="left")
         
         self.source_path = tk.StringVar()
-        source_entry = tk.Entry(load_controls_frame, textvariable=self.source_path, font=("Arial", 10), state="readonly")
+        source_entry = tk.Entry(load_controls_frame, textvariable=self.source_path, font=self.fonts['body'], state="readonly")
         source_entry.pack(side="left", fill="x", expand=True, padx=(10, 5))
         
         browse_source_button = tk.Button(
             load_controls_frame,
             text="Browse...",
             command=self.browse_source_image,
-            font=("Arial", 10)
+            font=self.fonts['body']
         )
         browse_source_button.pack(side="right", padx=(0, 5))
         
@@ -283,14 +629,14 @@ class ChannelPackerGUI:
             load_controls_frame,
             text="Extract Channels",
             command=self.extract_channels,
-            font=("Arial", 10),
+            font=self.fonts['body'],
             bg="#3498db",
             fg="white"
         )
         extract_button.pack(side="right")
         
         # Drop zones frame
-        drop_frame = tk.LabelFrame(self.root, text="Individual Channels", font=("Arial", 10, "bold"))
+        drop_frame = tk.LabelFrame(self.root, text="Individual Channels", font=self.fonts['heading'])
         drop_frame.pack(pady=10, padx=20, fill="x")
         
         zones_container = tk.Frame(drop_frame)
@@ -303,36 +649,36 @@ class ChannelPackerGUI:
         zones_container.grid_columnconfigure(3, weight=1)
         
         # Create drop zones
-        self.red_zone = DropZone(zones_container, "Red", "#e74c3c", self.update_button_states)
+        self.red_zone = DropZone(zones_container, "Red", "#e74c3c", self._schedule_button_state_update, self.fonts, gui=self, bit=1)
         self.red_zone.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
         
-        self.green_zone = DropZone(zones_container, "Green", "#27ae60", self.update_button_states)
+        self.green_zone = DropZone(zones_container, "Green", "#27ae60", self._schedule_button_state_update, self.fonts, gui=self, bit=2)
         self.green_zone.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
         
-        self.blue_zone = DropZone(zones_container, "Blue", "#3498db", self.update_button_states)
+        self.blue_zone = DropZone(zones_container, "Blue", "#3498db", self._schedule_button_state_update, self.fonts, gui=self, bit=4)
         self.blue_zone.grid(row=0, column=2, padx=5, pady=5, sticky="ew")
         
-        self.alpha_zone = DropZone(zones_container, "Alpha", "#9b59b6", self.update_button_states)
+        self.alpha_zone = DropZone(zones_container, "Alpha", "#9b59b6", self._schedule_button_state_update, self.fonts, gui=self, bit=8)
         self.alpha_zone.grid(row=0, column=3, padx=5, pady=5, sticky="ew")
         
         # Export individual channels section
-        export_frame = tk.LabelFrame(self.root, text="Export Individual Channels", font=("Arial", 10, "bold"))
+        export_frame = tk.LabelFrame(self.root, text="Export Individual Channels", font=self.fonts['heading'])
         export_frame.pack(pady=10, padx=20, fill="x")
         
         export_controls_frame = tk.Frame(export_frame)
         export_controls_frame.pack(fill="x", padx=10, pady=10)
         
-        tk.Label(export_controls_frame, text="Base filename:", font=("Arial", 10)).pack(side="left")
+        tk.Label(export_controls_frame, text="Base filename:", font=self.fonts['body']).pack(side="left")
         
         self.export_base_path = tk.StringVar(value="channels")
-        export_entry = tk.Entry(export_controls_frame, textvariable=self.export_base_path, font=("Arial", 10))
+        export_entry = tk.Entry(export_controls_frame, textvariable=self.export_base_path, font=self.fonts['body'])
         export_entry.pack(side="left", fill="x", expand=True, padx=(10, 5))
         
         export_browse_button = tk.Button(
             export_controls_frame,
             text="Browse...",
             command=self.browse_export_path,
-            font=("Arial", 10)
+            font=self.fonts['body']
         )
         export_browse_button.pack(side="right", padx=(0, 5))
         
@@ -340,7 +686,7 @@ class ChannelPackerGUI:
             export_controls_frame,
             text="Export All Channels",
             command=self.export_channels,
-            font=("Arial", 10),
+            font=self.fonts['body'],
             bg="#f39c12",
             fg="white",
             state="disabled"
@@ -348,22 +694,22 @@ class ChannelPackerGUI:
         self.export_channels_button.pack(side="right")
         
         # Output path selection
-        output_frame = tk.LabelFrame(self.root, text="Pack Channels Output", font=("Arial", 10, "bold"))
+        output_frame = tk.LabelFrame(self.root, text="Pack Channels Output", font=self.fonts['heading'])
         output_frame.pack(pady=10, padx=20, fill="x")
         
         path_frame = tk.Frame(output_frame)
         path_frame.pack(fill="x", padx=10, pady=10)
         
-        tk.Label(path_frame, text="Output file:", font=("Arial", 10)).pack(side="left")
+        tk.Label(path_frame, text="Output file:", font=self.fonts['body']).pack(side="left")
         
-        self.path_entry = tk.Entry(path_frame, textvariable=self.output_path, font=("Arial", 10))
+        self.path_entry = tk.Entry(path_frame, textvariable=self.output_path, font=self.fonts['body'])
         self.path_entry.pack(side="left", fill="x", expand=True, padx=(10, 5))
         
         browse_button = tk.Button(
             path_frame,
             text="Browse...",
             command=self.browse_output_path,
-            font=("Arial", 10)
+            font=self.fonts['body']
         )
         browse_button.pack(side="right")
         
@@ -371,7 +717,7 @@ class ChannelPackerGUI:
         resolution_frame = tk.Frame(output_frame)
         resolution_frame.pack(fill="x", padx=10, pady=(0, 10))
         
-        tk.Label(resolution_frame, text="Output resolution:", font=("Arial", 10)).pack(side="left")
+        tk.Label(resolution_frame, text="Output resolution:", font=self.fonts['body']).pack(side="left")
         
         # Resolution checkbox
         self.use_custom_resolution = tk.BooleanVar(value=False)
@@ -380,21 +726,32 @@ class ChannelPackerGUI:
             text="Custom resolution", 
             variable=self.use_custom_resolution,
             command=self.toggle_resolution_fields,
-            font=("Arial", 10)
+            font=self.fonts['body']
         )
         self.resolution_checkbox.pack(side="left", padx=(10, 5))
         
         # Width entry
-        tk.Label(resolution_frame, text="Width:", font=("Arial", 10)).pack(side="left", padx=(10, 0))
+        tk.Label(resolution_frame, text="Width:", font=self.fonts['body']).pack(side="left", padx=(10, 0))
         self.width_var = tk.StringVar(value="1024")
-        self.width_entry = tk.Entry(resolution_frame, textvariable=self.width_var, font=("Arial", 10), width=6, state="disabled")
+        self.width_entry = tk.Entry(resolution_frame, textvariable=self.width_var, font=self.fonts['body'], width=6, state="disabled")
         self.width_entry.pack(side="left", padx=(5, 0))
         
         # Height entry
-        tk.Label(resolution_frame, text="Height:", font=("Arial", 10)).pack(side="left", padx=(10, 0))
+        tk.Label(resolution_frame, text="Height:", font=self.fonts['body']).pack(side="left", padx=(10, 0))
         self.height_var = tk.StringVar(value="1024")
-        self.height_entry = tk.Entry(resolution_frame, textvariable=self.height_var, font=("Arial", 10), width=6, state="disabled")
+        self.height_entry = tk.Entry(resolution_frame, textvariable=self.height_var, font=self.fonts['body'], width=6, state="disabled")
         self.height_entry.pack(side="left", padx=(5, 0))
+
+        # Fast save trades ~10-20% file size for a 3-5x faster PNG encode;
+        # interactive use generally favors latency
+        self.fast_save = tk.BooleanVar(value=True)
+        self.fast_save_checkbox = tk.Checkbutton(
+            resolution_frame,
+            text="Fast save (larger file)",
+            variable=self.fast_save,
+            font=self.fonts['body']
+        )
+        self.fast_save_checkbox.pack(side="left", padx=(15, 0))
         
         # Control buttons
         button_frame = tk.Frame(self.root)
@@ -404,7 +761,7 @@ class ChannelPackerGUI:
             button_frame,
             text="Pack Channels",
             command=self.pack_images,
-            font=("Arial", 12, "bold"),
+            font=self.fonts['button'],
             bg="#27ae60",
             fg="white",
             state="disabled",
@@ -417,7 +774,7 @@ class ChannelPackerGUI:
             button_frame,
             text="Clear All Channels",
             command=self.clear_all,
-            font=("Arial", 12),
+            font=self.fonts['button_plain'],
             bg="#e74c3c",
             fg="white",
             width=15,
@@ -425,19 +782,23 @@ class ChannelPackerGUI:
         )
         clear_button.pack(side="left", padx=5)
         
-        # Progress bar
+        # Progress bar; determinate so the pack worker can report real
+        # phase progress instead of Tk repainting an animation at ~20 Hz
+        # for the whole pack
         self.progress = ttk.Progressbar(
             self.root,
-            mode='indeterminate',
+            mode='determinate',
+            maximum=100,
             length=400
         )
-        self.progress.pack(pady=10)
+        # Not packed here: the bar is mapped only while an operation is
+        # running, so an idle window keeps no progress widget to repaint
         
         # Status label
         self.status_label = tk.Label(
             self.root,
             text="Ready - Load channels individually or extract from multi-channel image",
-            font=("Arial", 10),
+            font=self.fonts['body'],
             fg="#7f8c8d"
         )
         self.status_label.pack(pady=5)
@@ -446,22 +807,14 @@ class ChannelPackerGUI:
         instructions = tk.Text(
             self.root,
             height=6,
-            font=("Arial", 9),
+            font=self.fonts['small'],
             bg="#f8f9fa",
             fg="#2c3e50",
             wrap="word",
             relief="flat"
         )
         instructions.pack(pady=10, padx=20, fill="x")
-        instructions.insert("1.0", 
-            "Instructions:\n"
-            "1. Load a multi-channel image (.png/.tga) and click 'Extract Channels' to auto-fill all channels\n"
-            "2. Or drag/drop individual images to each channel manually\n"
-            "3. Use 'Export All Channels' to save individual channel images as separate PNG files\n"
-            "4. Use 'Pack Channels' to combine channels into a single RGB/RGBA image\n"
-            "5. Enable 'Custom resolution' to resize the output image to a specific width and height\n"
-            "6. Alpha channel is supported for .tga and .png output formats"
-        )
+        instructions.insert("1.0", _INSTRUCTIONS)
         instructions.configure(state="disabled")
     
     def browse_source_image(self):
@@ -489,30 +842,48 @@ class ChannelPackerGUI:
             messagebox.showerror("Error", "Source file does not exist.")
             return
         
+        # Decode on the shared loader pool; the Tk thread only applies
+        # the resulting channels
+        self.status_label.configure(text="Extracting channels...", fg="#3498db")
+        future = _LOAD_EXECUTOR.submit(extract_channels_from_image, source_file)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._extract_done, f, os.path.basename(source_file)))
+
+    def _extract_done(self, future, source_filename):
+        """Main-thread handler: apply extracted channels to the zones."""
+        try:
+            channels = future.result()
+        except Exception as e:
+            self._show_error(f"Error extracting channels: {str(e)}")
+            return
+        if channels is None:
+            self._show_error("Failed to extract channels from the image.")
+            return
+
+        # Set the extracted channels to the drop zones with their
+        # callbacks suspended: one status/button refresh at the end
+        # instead of four
+        zones = (self.red_zone, self.green_zone, self.blue_zone, self.alpha_zone)
+        for zone in zones:
+            zone._suspend_callback = True
         try:
-            # Extract channels
-            channels = extract_channels_from_image(source_file)
-            if channels is None:
-                messagebox.showerror("Error", "Failed to extract channels from the image.")
-                return
-            
-            # Get filename for display
-            source_filename = os.path.basename(source_file)
-            
-            # Set the extracted channels to the drop zones
             self.red_zone.set_channel_image(channels.get('red'), source_filename)
             self.green_zone.set_channel_image(channels.get('green'), source_filename)
             self.blue_zone.set_channel_image(channels.get('blue'), source_filename)
             self.alpha_zone.set_channel_image(channels.get('alpha'), source_filename)
-            
-            self.update_button_states()
-            
-            # Show success message
-            channels_found = [name for name, img in channels.items() if img is not None]
-            messagebox.showinfo("Success", f"Successfully extracted channels: {', '.join(channels_found)}")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error extracting channels: {str(e)}")
+        finally:
+            for zone in zones:
+                zone._suspend_callback = False
+
+        # The mask may be unchanged (re-extracting, or a second image
+        # after the first); force the refresh so the transient
+        # "Extracting channels..." status is always replaced
+        self._last_mask = None
+        self.update_button_states()
+
+        # Show success message
+        channels_found = [name for name, img in channels.items() if img is not None]
+        messagebox.showinfo("Success", f"Successfully extracted channels: {', '.join(channels_found)}")
     
     def browse_export_path(self):
         """Browse for export base path."""
@@ -534,23 +905,22 @@ class ChannelPackerGUI:
             return
         
         try:
-            # Collect loaded channels
+            # Collect loaded channels, reloading any image that was
+            # released after a pack (original size, not the pack-resized copy)
             channels = {}
-            if self.red_zone.get_channel_image():
-                channels['red'] = self.red_zone.get_channel_image()
-            if self.green_zone.get_channel_image():
-                channels['green'] = self.green_zone.get_channel_image()
-            if self.blue_zone.get_channel_image():
-                channels['blue'] = self.blue_zone.get_channel_image()
-            if self.alpha_zone.get_channel_image():
-                channels['alpha'] = self.alpha_zone.get_channel_image()
+            zone_names = [('red', self.red_zone), ('green', self.green_zone),
+                          ('blue', self.blue_zone), ('alpha', self.alpha_zone)]
+            for name, zone in zone_names:
+                image = self._channel_image_for(zone)
+                if image is not None:
+                    channels[name] = image
             
             if not channels:
                 messagebox.showerror("Error", "No channels loaded to export.")
                 return
             
-            # Start progress bar
-            self.progress.start()
+            # Show the progress bar for the duration of the export
+            self._show_progress()
             self.export_channels_button.configure(state="disabled")
             self.status_label.configure(text="Exporting channels...", fg="#3498db")
             
@@ -572,7 +942,7 @@ class ChannelPackerGUI:
     
     def _export_complete(self, saved_files):
         """Called when export is complete."""
-        self.progress.stop()
+        self._hide_progress()
         self.export_channels_button.configure(state="normal")
         self.status_label.configure(text=f"Exported {len(saved_files)} channel(s) successfully!", fg="#27ae60")
         messagebox.showinfo("Success", f"Successfully exported {len(saved_files)} channels:\n" + "\n".join(saved_files))
@@ -580,18 +950,120 @@ class ChannelPackerGUI:
     
     def _export_error(self, error_message):
         """Called when export fails."""
-        self.progress.stop()
+        self._hide_progress()
         self.export_channels_button.configure(state="normal")
         self.status_label.configure(text="Error occurred during export", fg="#e74c3c")
         messagebox.showerror("Error", f"Failed to export channels:\n{error_message}")
         self.update_button_states()
     
+    def _check_channel_size(self, zone, size):
+        """Preflight dimension check when a channel is loaded.
+
+        The first channel sets the reference size; a later channel that
+        differs is flagged right away -- and pre-resized in the
+        background by _prepare_resized_images -- instead of surprising
+        the user after the Pack click.
+        """
+        if self._ref_size is None:
+            self._ref_size = size
+        elif size != self._ref_size:
+            # Which side gets resampled depends on the pack target (the
+            # largest source, or the custom resolution), so don't claim
+            # it's the new channel that will be resized
+            self._show_error(
+                f"{zone.channel_name} channel is {size[0]}x{size[1]}, "
+                f"others are {self._ref_size[0]}x{self._ref_size[1]}; "
+                "sizes will be reconciled when packing")
+
+    def _show_error(self, message):
+        """Show an error in the status bar without a modal dialog.
+
+        messagebox.showerror spins a nested event loop that blocks
+        further drops; a transient red status message keeps the UI live
+        and clears itself after a few seconds.
+        """
+        self.status_label.configure(text=message, fg="#e74c3c")
+        if self._status_clear_id is not None:
+            self.root.after_cancel(self._status_clear_id)
+        self._status_clear_id = self.root.after(3000, self._clear_status)
+
+    def _clear_status(self):
+        """Restore the regular status text after a transient error."""
+        self._status_clear_id = None
+        # The mask is unchanged but the status text must be rebuilt
+        self._last_mask = None
+        self.update_button_states()
+
+    def _schedule_button_state_update(self):
+        """Schedule update_button_states once per event-loop idle cycle.
+
+        Multiple zones firing callbacks in quick succession (multi-file
+        drop, channel extraction) collapse into a single status/button
+        refresh instead of one per zone.
+        """
+        if not self._button_update_pending:
+            self._button_update_pending = True
+            self.root.after_idle(self._do_update_button_states)
+
+    def _do_update_button_states(self):
+        self._button_update_pending = False
+        self.update_button_states()
+        self._prepare_resized_images()
+
+    def _prepare_resized_images(self):
+        """Pre-resize loaded channels to the pack target size while the
+        user is still arranging files, so the Pack click spends its time
+        in the encoder only."""
+        all_zones = (self.red_zone, self.green_zone, self.blue_zone, self.alpha_zone)
+        zones = [z for z in all_zones if z.channel_image is not None]
+        if len(zones) < 2:
+            return
+        if self.use_custom_resolution.get():
+            try:
+                target = (int(self.width_var.get()), int(self.height_var.get()))
+            except ValueError:
+                return
+            if target[0] <= 0 or target[1] <= 0:
+                return
+        else:
+            target = (max(z.channel_image.width for z in zones),
+                      max(z.channel_image.height for z in zones))
+        for zone in zones:
+            source = zone.channel_image
+            if source.size == target:
+                # Drop any copy staged for an earlier, different target
+                # so it can't leak into the pack
+                zone.resized_image = None
+                continue
+            if zone.resized_image is not None:
+                if _plane_size(zone.resized_image) == target:
+                    continue
+                zone.resized_image = None  # stale target
+            self._executor.submit(self._resize_zone_image, zone, source, target)
+
+    @staticmethod
+    def _resize_zone_image(zone, source, target):
+        """Executor job: resize one channel through the packer's own
+        resize_plane (cv2 when installed, Pillow otherwise), so the
+        pre-resized result is pixel-identical to what a pack without the
+        head start would produce."""
+        resized = resize_plane(source, target)
+        # A newer drop may have replaced the image while we resized
+        if zone.channel_image is source:
+            zone.resized_image = resized
+
     def update_button_states(self):
         """Update button states based on loaded channels."""
-        red_loaded = self.red_zone.get_channel_image() is not None
-        green_loaded = self.green_zone.get_channel_image() is not None
-        blue_loaded = self.blue_zone.get_channel_image() is not None
-        alpha_loaded = self.alpha_zone.get_channel_image() is not None
+        # Common no-op path: nothing changed since the last refresh
+        mask = self._loaded_mask
+        if mask == self._last_mask:
+            return
+        self._last_mask = mask
+
+        red_loaded = bool(mask & 1)
+        green_loaded = bool(mask & 2)
+        blue_loaded = bool(mask & 4)
+        alpha_loaded = bool(mask & 8)
         
         # Enable packing if at least one channel is loaded
         any_loaded = red_loaded or green_loaded or blue_loaded or alpha_loaded
@@ -658,8 +1130,8 @@ class ChannelPackerGUI:
                 output_file += '.png'
                 self.output_path.set(output_file)
             
-            # Start progress bar
-            self.progress.start()
+            # Show the progress bar; the worker reports real phases
+            self._show_progress()
             self.pack_button.configure(state="disabled")
             
             # Update status with resolution info if custom resolution is used
@@ -673,68 +1145,146 @@ class ChannelPackerGUI:
             else:
                 self.status_label.configure(text="Packing images...", fg="#3498db")
             
-            # Run packing in a separate thread to avoid freezing GUI
-            thread = threading.Thread(target=self._pack_images_thread, args=(output_file,))
-            thread.daemon = True
-            thread.start()
-            
+            # Submit to the single-worker executor; rapid clicks queue
+            # instead of spawning a thread (and a stack) per click
+            future = self._executor.submit(self._pack_images_thread, output_file)
+            future.add_done_callback(self._pack_done)
+
         except Exception as e:
-            self.progress.stop()
+            self._hide_progress()
             self.pack_button.configure(state="normal")
             messagebox.showerror("Error", f"Error starting pack operation: {str(e)}")
     
+    def _channel_image_for(self, zone):
+        """Return a zone's decoded PIL image, reloading from disk only if
+        it was released after an earlier pack. Used where a PIL image is
+        required (export); packing prefers _channel_data_for."""
+        image = zone.get_channel_image()
+        if image is None and zone.get_image_path():
+            image = load_grayscale_image(zone.get_image_path())
+        return image
+
+    def _channel_data_for(self, zone, target=None):
+        """Return a zone's channel for packing.
+
+        Prefers the background pre-resized copy -- but only when it
+        matches the actual pack target, so a copy staged for an earlier
+        target can never change the output -- then the cached uint8
+        array (pack_channels takes ndarrays directly, so the conversion
+        is not repeated per pack), then a reload from disk.
+        """
+        resized = zone.resized_image
+        if resized is not None and _plane_size(resized) == target:
+            return resized
+        array = zone.get_channel_array()
+        if array is not None:
+            return array
+        if zone.get_image_path():
+            return load_grayscale_image(zone.get_image_path())
+        return None
+
+    def _show_progress(self):
+        """Map the progress bar for the duration of an operation."""
+        self.progress.configure(value=0)
+        self.progress.pack(pady=10, before=self.status_label)
+
+    def _hide_progress(self):
+        """Unmap the progress bar so an idle window has nothing to repaint."""
+        self.progress.pack_forget()
+
+    def _report_progress(self, value):
+        """Post a progress value to the bar from the worker, rate-limited
+        to roughly one repaint per 33 ms."""
+        now = time.monotonic()
+        if value < 100 and now - self._last_progress_update < 0.033:
+            return
+        self._last_progress_update = now
+        self.root.after(0, lambda v=value: self.progress.configure(value=v))
+
     def _pack_images_thread(self, output_file):
-        """Thread function for packing images."""
-        try:
-            # Get channel images
-            red_image = self.red_zone.get_channel_image()
-            green_image = self.green_zone.get_channel_image()
-            blue_image = self.blue_zone.get_channel_image()
-            alpha_image = self.alpha_zone.get_channel_image()
-            
-            # Get custom resolution if enabled
-            output_resolution = None
-            if self.use_custom_resolution.get():
-                try:
-                    width = int(self.width_var.get())
-                    height = int(self.height_var.get())
-                    if width > 0 and height > 0:
-                        output_resolution = (width, height)
-                    else:
-                        self.root.after(0, messagebox.showerror, "Invalid Resolution", 
-                                         "Width and height must be positive integers.")
-                        self.root.after(0, self._pack_error, "Invalid resolution values")
-                        return
-                except ValueError:
-                    self.root.after(0, messagebox.showerror, "Invalid Resolution", 
-                                     "Width and height must be valid integers.")
-                    self.root.after(0, self._pack_error, "Invalid resolution format")
-                    return
-            
-            # Pack channels with optional resolution
-            pack_channels(red_image, green_image, blue_image, output_file, alpha_image, output_resolution)
-            
-            # Update GUI in main thread
-            self.root.after(0, self._pack_complete, output_file)
-            
-        except Exception as e:
-            self.root.after(0, self._pack_error, str(e))
-    
+        """Worker function for packing images; runs on the pack executor."""
+        self._report_progress(10)
+
+        # Get custom resolution if enabled
+        output_resolution = None
+        if self.use_custom_resolution.get():
+            try:
+                width = int(self.width_var.get())
+                height = int(self.height_var.get())
+            except ValueError:
+                raise ValueError("Width and height must be valid integers.")
+            if width <= 0 or height <= 0:
+                raise ValueError("Width and height must be positive integers.")
+            output_resolution = (width, height)
+
+        # The pack target a pre-resized copy must match to be usable:
+        # the custom resolution, or the largest source still in memory
+        # (a released zone reloads at its own size either way)
+        zones = [self.red_zone, self.green_zone, self.blue_zone, self.alpha_zone]
+        target = output_resolution
+        if target is None:
+            sizes = [z.channel_image.size for z in zones if z.channel_image is not None]
+            if sizes:
+                target = (max(w for w, h in sizes), max(h for w, h in sizes))
+
+        # Reuse the images decoded when the files were dropped; any
+        # cache-miss reloads run concurrently since PIL releases the
+        # GIL inside its decoders
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            red_image, green_image, blue_image, alpha_image = executor.map(
+                lambda zone: self._channel_data_for(zone, target), zones)
+        self._report_progress(40)
+
+        # Pack channels with optional resolution
+        compress_level = 1 if self.fast_save.get() else 6
+        self._report_progress(70)
+        pack_channels(red_image, green_image, blue_image, output_file, alpha_image, output_resolution,
+                      compress_level=compress_level)
+        self._report_progress(95)
+        return output_file
+
+    def _pack_done(self, future):
+        """Done-callback for a pack future; marshals the result to the
+        Tk thread."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.root.after(0, self._pack_error, str(error))
+        else:
+            self.root.after(0, self._pack_complete, future.result())
+
+
     def _pack_complete(self, output_file):
         """Called when packing is complete."""
-        self.progress.stop()
+        self._hide_progress()
         self.pack_button.configure(state="normal")
+
+        # Release the full-resolution buffers now that the pack is on
+        # disk; zones backed by a file reload lazily on the next pack,
+        # extracted channels (no path) keep their image. The decoder
+        # cache and prefetch cache hold their own references to the
+        # same images, so they go too -- otherwise nothing is actually
+        # freed. Collect on a background thread so a large cycle sweep
+        # can't stall the UI.
+        for zone in (self.red_zone, self.green_zone, self.blue_zone, self.alpha_zone):
+            if zone.image_path:
+                zone.channel_image = None
+                zone.channel_array = None
+            zone.resized_image = None
+        clear_image_cache()
+        _PREFETCH_CACHE.clear()
+        threading.Thread(target=gc.collect, daemon=True).start()
+
         self.status_label.configure(text=f"Success! Saved to {os.path.basename(output_file)}", fg="#27ae60")
         messagebox.showinfo("Success", f"Channels successfully packed!\nSaved to: {output_file}")
         self.update_button_states()
     
     def _pack_error(self, error_message):
         """Called when packing fails."""
-        self.progress.stop()
+        self._hide_progress()
         self.pack_button.configure(state="normal")
-        self.status_label.configure(text="Error occurred during packing", fg="#e74c3c")
-        messagebox.showerror("Error", f"Failed to pack channels:\n{error_message}")
-        self.update_button_states()
+        self._show_error(f"Pack failed: {error_message}")
     
     def clear_all(self):
         """Clear all loaded channels."""
@@ -746,20 +1296,35 @@ class ChannelPackerGUI:
         self.update_button_states()
 
 
+def _prewarm_pil():
+    """Run PIL's lazy plugin discovery off the critical path.
+
+    Image.init() scans and registers the format plugins (libpng/libjpeg
+    etc.); doing it here while the user is still positioning the window
+    removes the ~50-200 ms hitch from the first drop.
+    """
+    Image.init()
+    Image.new('L', (1, 1))
+
+
 def main():
     """Main function to run the enhanced GUI application."""
-    try:
+    tkdnd = _get_tkdnd()
+    if tkdnd is not None:
         root = tkdnd.TkinterDnD.Tk()
-        app = ChannelPackerGUI(root)
-        root.mainloop()
-    except ImportError:
+    else:
         # Fallback if tkinterdnd2 is not available
         print("Warning: tkinterdnd2 not found. Drag-and-drop will not be available.")
         print("Install it with: pip install tkinterdnd2")
-        
         root = tk.Tk()
-        app = ChannelPackerGUI(root)
-        root.mainloop()
+
+    threading.Thread(target=_prewarm_pil, daemon=True).start()
+    # Touch the Tk photo subsystem once the window is up so the first
+    # real preview doesn't pay its one-time initialization
+    root.after(50, lambda: ImageTk.PhotoImage(Image.new('L', (1, 1))))
+
+    app = ChannelPackerGUI(root)
+    root.mainloop()
 
 
 if __name__ == "__main__":
@@ -7,8 +7,39 @@ A tool to split images into smaller pieces based on grid specifications.
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from PIL import Image, ImageTk
+import numpy as np
+import io
 import os
 import math
+import itertools
+import queue
+import threading
+import concurrent.futures
+
+# The preview only exists to show grid placement at <=400px, so a cheap
+# 2x2-tap filter is plenty; the split itself crops without resampling
+PREVIEW_FILTER = Image.Resampling.BILINEAR
+
+# Cap on cached preview+grid composites; scrubbing the 1-20 spinboxes
+# could otherwise accumulate hundreds of full-preview RGB images
+GRID_CACHE_MAX = 16
+
+
+def _encode_tile(tile):
+    # PNG encoding runs in libpng/zlib with the GIL released, so tile
+    # encodes on separate worker threads genuinely overlap.  zlib level 1
+    # costs a fraction of the default level 6 for only slightly larger
+    # files; optimize=False skips an extra filter-search pass.  Encoding
+    # to memory keeps the CPU pool off the disk entirely
+    buf = io.BytesIO()
+    Image.fromarray(tile).save(buf, "PNG", compress_level=1, optimize=False)
+    return buf.getvalue()
+
+
+def _write_tile(filepath, data):
+    with open(filepath, 'wb') as f:
+        f.write(data)
+
 
 class ImageSplitterGUI:
     def __init__(self, root):
@@ -27,7 +58,25 @@ class ImageSplitterGUI:
         self.cols = tk.IntVar(master=self.root, value=2)
         self.original_image = None
         self.preview_image = None
-        
+        # HxWxC uint8 view of the loaded image; preview resizes wrap it
+        # zero-copy and the split slices tiles straight out of it
+        self._np = None
+        # True when original_image is a reduced JPEG draft decode and
+        # split_image must reopen the file at full resolution
+        self._draft_preview = False
+        # Resized preview and its PhotoImage keyed by target size, so
+        # spinbox changes only redraw grid lines instead of resampling
+        self._preview_cache = {}
+        # Composed preview+grid PIL images keyed by (w, h, rows, cols);
+        # cleared whenever the source image changes
+        self._grid_cache = {}
+        # Canvas item id of the base preview image, reused across redraws
+        self._image_item = None
+        # Pending after() id used to coalesce rapid spinbox events
+        self._preview_job = None
+        # Last (rows, cols) seen, to drop duplicate change events
+        self._last_grid = None
+
         self.setup_ui()
         
     def setup_ui(self):
@@ -60,12 +109,12 @@ class ImageSplitterGUI:
         grid_frame.columnconfigure(3, weight=1)
         
         ttk.Label(grid_frame, text="Rows:").grid(row=0, column=0, sticky=tk.W, padx=5)
-        ttk.Spinbox(grid_frame, from_=1, to=20, textvariable=self.rows, width=10, 
-                   command=self.update_preview).grid(row=0, column=1, sticky=tk.W, padx=5)
-        
+        ttk.Spinbox(grid_frame, from_=1, to=20, textvariable=self.rows, width=10,
+                   command=self._on_grid_change).grid(row=0, column=1, sticky=tk.W, padx=5)
+
         ttk.Label(grid_frame, text="Columns:").grid(row=0, column=2, sticky=tk.W, padx=5)
         ttk.Spinbox(grid_frame, from_=1, to=20, textvariable=self.cols, width=10,
-                   command=self.update_preview).grid(row=0, column=3, sticky=tk.W, padx=5)
+                   command=self._on_grid_change).grid(row=0, column=3, sticky=tk.W, padx=5)
         
         # Info label
         self.info_label = ttk.Label(grid_frame, text="This will create 4 images (2×2)")
@@ -76,7 +125,8 @@ class ImageSplitterGUI:
         button_frame.grid(row=3, column=0, columnspan=3, pady=10)
         
         ttk.Button(button_frame, text="Preview", command=self.preview_split).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Split Image", command=self.split_image).pack(side=tk.LEFT, padx=5)
+        self.split_button = ttk.Button(button_frame, text="Split Image", command=self.split_image)
+        self.split_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Clear", command=self.clear_all).pack(side=tk.LEFT, padx=5)
         
         # Progress bar
@@ -107,12 +157,14 @@ class ImageSplitterGUI:
         h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
         self.canvas.configure(xscrollcommand=h_scrollbar.set)
         
-        # Bind events
-        self.rows.trace('w', self.update_info)
-        self.cols.trace('w', self.update_info)
-        
+        # A single handler serves both the Spinbox buttons and typed
+        # edits; its (rows, cols) snapshot drops the duplicate
+        # command+trace firing an arrow click produces
+        self.rows.trace('w', self._on_grid_change)
+        self.cols.trace('w', self._on_grid_change)
+
         # Initialize
-        self.update_info()
+        self._on_grid_change()
         
     def browse_image(self):
         filename = filedialog.askopenfilename(
@@ -133,16 +185,54 @@ class ImageSplitterGUI:
             
     def load_image(self):
         try:
-            self.original_image = Image.open(self.image_path.get())
+            image = Image.open(self.image_path.get())
+            # For JPEGs, let libjpeg decode at reduced scale straight in
+            # the DCT domain: the preview is capped at 400px, so a full
+            # resolution decode of a large photo is wasted work
+            self._draft_preview = False
+            if image.format == 'JPEG' and hasattr(image, 'draft'):
+                image.draft(None, (400, 400))
+                self._draft_preview = True
+            if image.mode in ('P', '1'):
+                # Keep the numpy layout regular; fromarray can't
+                # round-trip palette/bilevel data
+                image = image.convert('RGB')
+            self.original_image = image
+            self._np = np.asarray(image)
+            self._preview_cache.clear()
+            self._grid_cache.clear()
             self.update_preview()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load image: {str(e)}")
             
-    def update_info(self, *args):
-        total_images = self.rows.get() * self.cols.get()
-        self.info_label.config(text=f"This will create {total_images} images ({self.rows.get()}×{self.cols.get()})")
-        
+    def _on_grid_change(self, *args):
+        # Read the Tk variables once and fan out from the captured
+        # values instead of each consumer doing its own Tcl round-trips
+        try:
+            rows = self.rows.get()
+            cols = self.cols.get()
+        except tk.TclError:
+            return  # field empty or mid-edit
+        if rows < 1 or cols < 1:
+            return  # typed value below the Spinbox bound
+        if (rows, cols) == self._last_grid:
+            return
+        self._last_grid = (rows, cols)
+        self.info_label.config(text=f"This will create {rows * cols} images ({rows}×{cols})")
+        self.update_preview()
+
     def update_preview(self, *args):
+        # Holding a spinbox arrow fires dozens of events; a 100 ms
+        # debounce window collapses the burst into a single redraw while
+        # staying imperceptible for single clicks
+        if not self.original_image:
+            return
+        if self._preview_job is not None:
+            self.root.after_cancel(self._preview_job)
+        self._preview_job = self.root.after(100, self._do_preview)
+
+    def _do_preview(self):
+        self._preview_job = None
         if self.original_image:
             self.preview_split()
             
@@ -151,106 +241,219 @@ class ImageSplitterGUI:
             messagebox.showwarning("Warning", "Please select an image first.")
             return
             
-        # Create preview with grid lines
-        preview_img = self.original_image.copy()
-        
-        # Calculate dimensions
-        img_width, img_height = preview_img.size
-        piece_width = img_width // self.cols.get()
-        piece_height = img_height // self.rows.get()
-        
-        # Resize for preview if too large
+        # Calculate preview dimensions (capped for display)
+        img_width, img_height = self.original_image.size
         max_preview_size = 400
         if img_width > max_preview_size or img_height > max_preview_size:
             ratio = min(max_preview_size / img_width, max_preview_size / img_height)
             new_width = int(img_width * ratio)
             new_height = int(img_height * ratio)
-            preview_img = preview_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Recalculate piece dimensions for preview
-            piece_width = new_width // self.cols.get()
-            piece_height = new_height // self.rows.get()
-        
-        # Convert to PhotoImage for display
-        self.preview_image = ImageTk.PhotoImage(preview_img)
-        
-        # Clear canvas and display image
-        self.canvas.delete("all")
-        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.preview_image)
-        
-        # Draw grid lines
-        for i in range(1, self.cols.get()):
-            x = i * piece_width
-            self.canvas.create_line(x, 0, x, preview_img.height, fill="red", width=2)
-            
-        for i in range(1, self.rows.get()):
-            y = i * piece_height
-            self.canvas.create_line(0, y, preview_img.width, y, fill="red", width=2)
-            
+        else:
+            new_width, new_height = img_width, img_height
+
+        # The resize only depends on the target size, not on rows/
+        # cols, so the resized base is cached; rows/cols changes then
+        # cost one stripe pass instead of a full resample per keystroke
+        preview_img = self._preview_cache.get((new_width, new_height))
+        if preview_img is None:
+            # fromarray wraps the numpy pixels without copying, so both
+            # paths read the same buffer
+            preview_img = Image.fromarray(self._np) if self._np is not None else self.original_image
+            if (new_width, new_height) != (img_width, img_height):
+                # reducing_gap folds the bulk of a large downscale into a
+                # cheap box-reduce before the proper resample runs
+                preview_img = preview_img.resize((new_width, new_height), PREVIEW_FILTER,
+                                                 reducing_gap=2.0)
+            if preview_img.mode != 'RGB':
+                preview_img = preview_img.convert('RGB')
+            self._preview_cache[(new_width, new_height)] = preview_img
+
+        rows = self.rows.get()
+        cols = self.cols.get()
+        if rows < 1 or cols < 1:
+            return  # typed value below the Spinbox bound
+        piece_width = new_width // cols
+        piece_height = new_height // rows
+
+        # Stripe the red grid straight into a copy of the preview
+        # pixels: one fused numpy pass and a single canvas item instead
+        # of a Tk line item per boundary (up to 38 of them at 20x20).
+        # The composed photo is cached per grid geometry
+        key = (new_width, new_height, rows, cols)
+        composed = self._grid_cache.get(key)
+        if composed is None:
+            arr = np.array(preview_img)
+            for i in range(1, cols):
+                x = i * piece_width
+                arr[:, max(x - 1, 0):x + 1] = (255, 0, 0)
+            for i in range(1, rows):
+                y = i * piece_height
+                arr[max(y - 1, 0):y + 1, :] = (255, 0, 0)
+            composed = Image.fromarray(arr)
+            if len(self._grid_cache) >= GRID_CACHE_MAX:
+                self._grid_cache.pop(next(iter(self._grid_cache)))
+            self._grid_cache[key] = composed
+
+        # One Tk pixmap for the whole preview: when the size is
+        # unchanged the new pixels are pasted into the existing
+        # PhotoImage instead of allocating a fresh server-side pixmap
+        # per refresh.  The strong ref keeps Tk from dropping it.
+        photo = self.preview_image
+        if (photo is not None
+                and (photo.width(), photo.height()) == composed.size):
+            photo.paste(composed)
+        else:
+            photo = ImageTk.PhotoImage(composed)
+            self.preview_image = photo
+
+        # Reuse the canvas item; Tk just repaints with the new photo
+        canvas = self.canvas
+        if self._image_item is None:
+            self._image_item = canvas.create_image(0, 0, anchor=tk.NW, image=photo)
+        else:
+            canvas.itemconfigure(self._image_item, image=photo)
+
         # Update canvas scroll region
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        canvas.configure(scrollregion=canvas.bbox("all"))
         
+    def _full_array(self, image_path):
+        # The preview may be a reduced JPEG draft decode; the split
+        # itself always works on full-resolution pixels
+        if self._draft_preview:
+            source = Image.open(image_path)
+            if source.mode in ('P', '1'):
+                source = source.convert('RGB')
+            return np.asarray(source)
+        return self._np
+
     def split_image(self):
         if not self.original_image:
             messagebox.showwarning("Warning", "Please select an image first.")
             return
-            
+
         if not self.output_dir.get():
             messagebox.showwarning("Warning", "Please select an output directory.")
             return
-            
+
+        # Snapshot the Tk variables once; every .get() is a Tcl
+        # round-trip and the worker thread must not touch Tk at all
+        rows = self.rows.get()
+        cols = self.cols.get()
+        output_dir = self.output_dir.get()
+        image_path = self.image_path.get()
+
+        # Reject non-positive and too-fine grids up front; the worker
+        # would otherwise divide by zero or churn out streams of empty
+        # tiles.  The Spinbox bounds are 1-20 but typed values bypass
+        # them.
+        if rows < 1 or cols < 1:
+            messagebox.showwarning("Warning", "Rows and columns must be at least 1.")
+            return
+        try:
+            if self._np is not None and not self._draft_preview:
+                img_height, img_width = self._np.shape[:2]
+            else:
+                with Image.open(image_path) as im:  # header read only
+                    img_width, img_height = im.size
+        except Exception:
+            img_width = img_height = None  # let the worker surface the load error
+        if img_width is not None and (cols > img_width or rows > img_height):
+            messagebox.showwarning(
+                "Warning",
+                f"Cannot split a {img_width}x{img_height} image into {rows}x{cols} pieces.")
+            return
+
+        self.progress['maximum'] = rows * cols
+        self.progress['value'] = 0
+        self.split_button.configure(state='disabled')
+
+        # The heavy work runs off the Tk thread so the event loop keeps
+        # painting and scrolling; progress comes back through a queue
+        # drained by a short after() polling loop on the Tk thread
+        self._progress_queue = queue.Queue()
+        threading.Thread(target=self._split_worker,
+                         args=(image_path, output_dir, rows, cols),
+                         daemon=True).start()
+        self._poll_progress()
+
+    def _split_worker(self, image_path, output_dir, rows, cols):
+        report = self._progress_queue.put
         try:
             # Create output directory if it doesn't exist
-            os.makedirs(self.output_dir.get(), exist_ok=True)
-            
-            # Get image dimensions
-            img_width, img_height = self.original_image.size
-            piece_width = img_width // self.cols.get()
-            piece_height = img_height // self.rows.get()
-            
-            # Calculate total pieces for progress bar
-            total_pieces = self.rows.get() * self.cols.get()
-            self.progress['maximum'] = total_pieces
-            self.progress['value'] = 0
-            
-            # Get base filename
-            base_name = os.path.splitext(os.path.basename(self.image_path.get()))[0]
-            
+            os.makedirs(output_dir, exist_ok=True)
+
+            base_name = os.path.splitext(os.path.basename(image_path))[0]
+
+            # Full-resolution pixels; the preview may be draft-reduced
+            arr = self._full_array(image_path)
+            img_height, img_width = arr.shape[:2]
+            piece_width = img_width // cols
+            piece_height = img_height // rows
+
+            # Tile boundaries as closed coordinate lists: the trailing
+            # image edge makes the last row/column absorb any remainder
+            # without per-tile special cases
+            xs = [col * piece_width for col in range(cols)] + [img_width]
+            ys = [row * piece_height for row in range(rows)] + [img_height]
+            jobs = [(xs[col], ys[row], xs[col + 1], ys[row + 1],
+                     os.path.join(output_dir, f"{base_name}_piece_{row+1}_{col+1}.png"))
+                    for row, col in itertools.product(range(rows), range(cols))]
+
+            # Producer/consumer pipeline: the CPU pool encodes tiles to
+            # memory while a small writer pool flushes finished bytes to
+            # disk, so the next encode never waits on the filesystem.
+            # Each write reports from its done-callback so the bar ticks
+            # per tile throughout, not only after the last encode.
             piece_count = 0
-            
-            # Split the image
-            for row in range(self.rows.get()):
-                for col in range(self.cols.get()):
-                    # Calculate crop box
-                    left = col * piece_width
-                    top = row * piece_height
-                    right = left + piece_width
-                    bottom = top + piece_height
-                    
-                    # Handle edge cases (last row/column might be slightly different)
-                    if col == self.cols.get() - 1:
-                        right = img_width
-                    if row == self.rows.get() - 1:
-                        bottom = img_height
-                    
-                    # Crop and save
-                    piece = self.original_image.crop((left, top, right, bottom))
-                    filename = f"{base_name}_piece_{row+1}_{col+1}.png"
-                    filepath = os.path.join(self.output_dir.get(), filename)
-                    piece.save(filepath, "PNG")
-                    
-                    # Update progress
+            count_lock = threading.Lock()
+
+            def tile_written(future):
+                nonlocal piece_count
+                if future.exception() is not None:
+                    return  # surfaced by the result check below
+                with count_lock:
                     piece_count += 1
-                    self.progress['value'] = piece_count
-                    if hasattr(self.root, 'update_idletasks'):
-                        self.root.update_idletasks()
-            
-            messagebox.showinfo("Success", f"Image split into {total_pieces} pieces successfully!\nSaved to: {self.output_dir.get()}")
-            
+                    report(('progress', piece_count))
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as encoders, \
+                    concurrent.futures.ThreadPoolExecutor(max_workers=2) as writers:
+                encodes = {encoders.submit(_encode_tile, arr[top:bottom, left:right]): filepath
+                           for left, top, right, bottom, filepath in jobs}
+                writes = []
+                for future in concurrent.futures.as_completed(encodes):
+                    write = writers.submit(_write_tile, encodes[future], future.result())
+                    write.add_done_callback(tile_written)
+                    writes.append(write)
+                for future in concurrent.futures.as_completed(writes):
+                    future.result()  # propagate the first write error
+
+            report(('done', (rows * cols, output_dir)))
+
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to split image: {str(e)}")
-        finally:
-            self.progress['value'] = 0
+            report(('error', str(e)))
+
+    def _poll_progress(self):
+        # Drain whatever the worker has queued; re-arm until it reports
+        # completion so the Tk thread owns every widget update
+        try:
+            while True:
+                kind, payload = self._progress_queue.get_nowait()
+                if kind == 'progress':
+                    self.progress['value'] = payload
+                elif kind == 'done':
+                    total_pieces, output_dir = payload
+                    self.progress['value'] = 0
+                    self.split_button.configure(state='normal')
+                    messagebox.showinfo("Success", f"Image split into {total_pieces} pieces successfully!\nSaved to: {output_dir}")
+                    return
+                else:
+                    self.progress['value'] = 0
+                    self.split_button.configure(state='normal')
+                    messagebox.showerror("Error", f"Failed to split image: {payload}")
+                    return
+        except queue.Empty:
+            pass
+        self.root.after(50, self._poll_progress)
             
     def clear_all(self):
         self.image_path.set("")
@@ -259,7 +462,12 @@ class ImageSplitterGUI:
         self.cols.set(2)
         self.original_image = None
         self.preview_image = None
+        self._np = None
+        self._draft_preview = False
+        self._preview_cache.clear()
+        self._grid_cache.clear()
         self.canvas.delete("all")
+        self._image_item = None
         self.progress['value'] = 0
 
 def main():